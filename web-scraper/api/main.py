@@ -2,11 +2,16 @@
 Simple FastAPI implementation to serve the scraped data.
 """
 
+import queue
 import sqlite3
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 
+DB_FILE = "products.db"
+POOL_SIZE = 4
+
 app = FastAPI(
     title="JustYol Product API",
     description="API for accessing scraped JustYol product data",
@@ -25,6 +30,46 @@ class Product(BaseModel):
     image_url: Optional[str] = None
 
 
+def _connect() -> sqlite3.Connection:
+    """Open a database connection configured for read-heavy API use."""
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+
+@app.on_event("startup")
+def open_connection_pool():
+    """Open the pooled database connections so their page caches stay warm across requests."""
+    app.state.pool = queue.Queue(maxsize=POOL_SIZE)
+    for _ in range(POOL_SIZE):
+        app.state.pool.put(_connect())
+
+
+@app.on_event("shutdown")
+def close_connection_pool():
+    """Close all pooled database connections."""
+    while not app.state.pool.empty():
+        app.state.pool.get_nowait().close()
+
+
+@contextmanager
+def get_connection() -> Iterator[sqlite3.Connection]:
+    """
+    Borrow a connection from the pool.
+    
+    Yields:
+        A pooled SQLite connection, returned to the pool on exit
+    """
+    conn = app.state.pool.get()
+    try:
+        yield conn
+    finally:
+        app.state.pool.put(conn)
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint that returns API information."""
@@ -53,11 +98,6 @@ async def get_products(limit: int = 100, offset: int = 0, brand: Optional[str] =
         List of products
     """
     try:
-        # Connect to the database
-        conn = sqlite3.connect("products.db")
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
         # Build the query
         query = "SELECT id, name, brand, price, original_price, discount, url, image_url FROM products"
         params = []
@@ -71,14 +111,12 @@ async def get_products(limit: int = 100, offset: int = 0, brand: Optional[str] =
         query += " LIMIT ? OFFSET ?"
         params.extend([limit, offset])
         
-        # Execute the query
-        cursor.execute(query, params)
-        
-        # Convert the results to a list of dictionaries
-        products = [dict(row) for row in cursor.fetchall()]
-        
-        # Close the connection
-        conn.close()
+        # Execute the query on a pooled connection
+        with get_connection() as conn:
+            cursor = conn.execute(query, params)
+            
+            # Convert the results to a list of dictionaries
+            products = [dict(row) for row in cursor.fetchall()]
         
         return products
     except Exception as e:
@@ -97,22 +135,15 @@ async def get_product(product_id: int):
         Product details
     """
     try:
-        # Connect to the database
-        conn = sqlite3.connect("products.db")
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        # Query the product
-        cursor.execute(
-            "SELECT id, name, brand, price, original_price, discount, url, image_url FROM products WHERE id = ?",
-            (product_id,)
-        )
-        
-        # Get the result
-        product = cursor.fetchone()
-        
-        # Close the connection
-        conn.close()
+        # Query the product on a pooled connection
+        with get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT id, name, brand, price, original_price, discount, url, image_url FROM products WHERE id = ?",
+                (product_id,)
+            )
+            
+            # Get the result
+            product = cursor.fetchone()
         
         if product:
             return dict(product)
@@ -131,19 +162,12 @@ async def get_brands():
         List of unique brands
     """
     try:
-        # Connect to the database
-        conn = sqlite3.connect("products.db")
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        # Query the brands
-        cursor.execute("SELECT DISTINCT brand FROM products WHERE brand IS NOT NULL")
-        
-        # Get the results
-        brands = [row['brand'] for row in cursor.fetchall()]
-        
-        # Close the connection
-        conn.close()
+        # Query the brands on a pooled connection
+        with get_connection() as conn:
+            cursor = conn.execute("SELECT DISTINCT brand FROM products WHERE brand IS NOT NULL")
+            
+            # Get the results
+            brands = [row['brand'] for row in cursor.fetchall()]
         
         return {"brands": brands}
     except Exception as e:
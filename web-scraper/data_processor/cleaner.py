@@ -3,34 +3,122 @@ Functions for cleaning and processing scraped data.
 """
 
 import re
-from typing import List, Dict, Any, Union
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator, Union
+
+import pandas as pd
+
+# Columns of a cleaned product record, in output order
+PRODUCT_FIELDS = ['name', 'brand', 'price', 'original_price', 'discount', 'url', 'image_url']
+
+# Patterns used by the cleaning functions, compiled once at import time
+_WS_RE = re.compile(r'\s+')
+_PRICE_RE = re.compile(r'(\d+(?:\.\d+)?)')
+_DISCOUNT_RE = re.compile(r'-?(\d+)%?')
+
+# Number of products cleaned together by clean_product_data_iter
+CLEAN_BATCH_SIZE = 1000
 
 
 def clean_product_data(products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Clean and process the scraped product data.
     
+    The cleaning is done column by column with pandas string methods, so
+    each regex runs once over the whole column instead of once per product.
+    
     Args:
         products: List of standardized product dictionaries
         
     Returns:
         List of cleaned product dictionaries
     """
-    cleaned_products = []
+    df = pd.DataFrame(list(products), columns=PRODUCT_FIELDS)
+    if df.empty:
+        return []
+    
+    # Remove extra whitespace from names
+    # Cast first so the .str accessor also works when no name is a string
+    df['name'] = _present(df['name']).astype(object).str.replace(_WS_RE, ' ', regex=True).str.strip()
+    
+    # Extract the numeric parts of the price and discount strings
+    df['price'] = _extract_number(df['price'], _PRICE_RE)
+    df['original_price'] = _extract_number(df['original_price'], _PRICE_RE)
+    # Numeric discounts go through the regex too, as in clean_discount
+    df['discount'] = _extract_number(df['discount'], _DISCOUNT_RE, numeric=False).astype('Int64')
+    
+    # Replace missing values with None so the records serialize cleanly
+    df = df.astype(object).where(df.notna(), None)
+    
+    return df.to_dict('records')
+
+
+def clean_product_data_iter(products: Iterable[Dict[str, Any]], batch_size: int = CLEAN_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Clean the product data lazily, one batch of products at a time.
     
-    for product in products:
-        cleaned_product = {
-            'name': clean_name(product.get('name')),
-            'brand': product.get('brand'),
-            'price': clean_price(product.get('price')),
-            'original_price': clean_price(product.get('original_price')),
-            'discount': clean_discount(product.get('discount')),
-            'url': product.get('url'),
-            'image_url': product.get('image_url')
-        }
-        cleaned_products.append(cleaned_product)
+    Only one batch is held in memory, while each batch still gets the
+    column-wise cleaning of clean_product_data.
     
-    return cleaned_products
+    Args:
+        products: Iterable of standardized product dictionaries
+        batch_size: Number of products to clean together
+        
+    Yields:
+        Cleaned product dictionaries
+    """
+    products = iter(products)
+    while True:
+        batch = list(islice(products, batch_size))
+        if not batch:
+            return
+        yield from clean_product_data(batch)
+
+
+def _present(column: pd.Series) -> pd.Series:
+    """
+    Mask out the empty values of a column.
+    
+    Args:
+        column: Raw column of product values
+        
+    Returns:
+        The column with falsy values replaced by NaN
+    """
+    return column.where(column.notna() & column.astype(bool))
+
+
+def _extract_number(column: pd.Series, pattern: re.Pattern, numeric: bool = True) -> pd.Series:
+    """
+    Extract the first number matched by pattern from each value of a column.
+    
+    Prices and discounts repeat a lot across a collection ("-50%", "199 dh"),
+    so each distinct value is parsed once and the result is broadcast back.
+    
+    Args:
+        column: Raw column of price or discount values
+        pattern: Compiled regex with the number as its first group
+        numeric: Whether int and float values are used as they are instead of being parsed
+        
+    Returns:
+        Numeric column, with NaN where no number could be extracted
+    """
+    present = _present(column).dropna()
+    result = pd.Series(float('nan'), index=present.index)
+    
+    # Numeric values need no parsing
+    if numeric:
+        is_number = present.map(lambda value: isinstance(value, (int, float)) and not isinstance(value, bool)).astype(bool)
+        result[is_number] = present[is_number].astype(float)
+        present = present[~is_number]
+    
+    text = present.astype(str)
+    codes, uniques = pd.factorize(text)
+    extracted = pd.Series(uniques, dtype=object).str.extract(pattern, expand=False)
+    # float() reads every digit \d matches, including the Arabic-Indic ones pd.to_numeric rejects
+    numbers = extracted.map(float, na_action='ignore')
+    result[text.index] = numbers.to_numpy(dtype=float)[codes]
+    return result.reindex(column.index)
 
 
 def clean_name(name: str) -> str:
@@ -47,7 +135,7 @@ def clean_name(name: str) -> str:
         return None
     
     # Remove extra whitespace
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = _WS_RE.sub(' ', name).strip()
     
     return name
 
@@ -65,8 +153,12 @@ def clean_price(price: str) -> float:
     if not price:
         return None
     
+    # Numeric prices need no parsing
+    if isinstance(price, (int, float)) and not isinstance(price, bool):
+        return float(price)
+    
     # Extract numeric part from price string
-    match = re.search(r'(\d+(?:\.\d+)?)', str(price))
+    match = _PRICE_RE.search(price if isinstance(price, str) else str(price))
     if match:
         try:
             return float(match.group(1))
@@ -90,7 +182,7 @@ def clean_discount(discount: str) -> int:
         return None
     
     # Extract numeric part from discount string
-    match = re.search(r'-?(\d+)%?', str(discount))
+    match = _DISCOUNT_RE.search(discount if isinstance(discount, str) else str(discount))
     if match:
         try:
             return int(match.group(1))
@@ -3,18 +3,54 @@ Functions for saving processed data to various output formats.
 """
 
 import csv
-import json
+import orjson
 import sqlite3
+from contextlib import contextmanager
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Dict, Any, IO, Iterable, Iterator
 
+from data_processor.cleaner import PRODUCT_FIELDS
 
-def save_to_csv(products: List[Dict[str, Any]], filename: str) -> str:
+# Projects a cleaned product onto a row tuple in PRODUCT_FIELDS order
+_ROW_GETTER = itemgetter(*PRODUCT_FIELDS)
+
+# Inserts one product row, with the columns in PRODUCT_FIELDS order
+_INSERT_SQL = f"INSERT INTO products ({', '.join(PRODUCT_FIELDS)}) VALUES ({', '.join('?' * len(PRODUCT_FIELDS))})"
+
+
+@contextmanager
+def _replace_when_written(file_path: Path, mode: str, **kwargs: Any) -> Iterator[IO]:
+    """
+    Open a temporary file that replaces file_path once it is fully written.
+    
+    The products are often a lazy stream that can still fail partway, in
+    which case the previous file is kept instead of a truncated one.
+    
+    Args:
+        file_path: The file to write
+        mode: Mode to open the temporary file in
+        **kwargs: Other arguments passed to open
+        
+    Yields:
+        The open temporary file
+    """
+    temp_path = file_path.with_name(file_path.name + '.tmp')
+    try:
+        with open(temp_path, mode, **kwargs) as file:
+            yield file
+        temp_path.replace(file_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def save_to_csv(products: Iterable[Dict[str, Any]], filename: str) -> str:
     """
     Save the products to a CSV file.
     
     Args:
-        products: List of product dictionaries
+        products: Iterable of cleaned product dictionaries, each with every
+            field in PRODUCT_FIELDS
         filename: Output filename
         
     Returns:
@@ -22,25 +58,22 @@ def save_to_csv(products: List[Dict[str, Any]], filename: str) -> str:
     """
     file_path = Path(filename)
     
-    with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-        # Define the CSV columns
-        fieldnames = ['name', 'brand', 'price', 'original_price', 'discount', 'url', 'image_url']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+    with _replace_when_written(file_path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
         
-        # Write the header and data
-        writer.writeheader()
-        for product in products:
-            writer.writerow(product)
+        # Write the header, then the data projected to the column order
+        writer.writerow(PRODUCT_FIELDS)
+        writer.writerows(map(_ROW_GETTER, products))
     
     return str(file_path.absolute())
 
 
-def save_to_json(products: List[Dict[str, Any]], filename: str) -> str:
+def save_to_json(products: Iterable[Dict[str, Any]], filename: str) -> str:
     """
     Save the products to a JSON file.
     
     Args:
-        products: List of product dictionaries
+        products: Iterable of product dictionaries
         filename: Output filename
         
     Returns:
@@ -48,18 +81,25 @@ def save_to_json(products: List[Dict[str, Any]], filename: str) -> str:
     """
     file_path = Path(filename)
     
-    with open(file_path, 'w', encoding='utf-8') as jsonfile:
-        json.dump(products, jsonfile, indent=2, ensure_ascii=False)
+    with _replace_when_written(file_path, 'wb') as jsonfile:
+        # Write one product at a time instead of serializing the whole list,
+        # keeping the same layout as json.dump(products, indent=2)
+        separator = b'[\n  '
+        for product in products:
+            jsonfile.write(separator)
+            jsonfile.write(orjson.dumps(product, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  '))
+            separator = b',\n  '
+        jsonfile.write(b'\n]' if separator != b'[\n  ' else b'[]')
     
     return str(file_path.absolute())
 
 
-def save_to_sqlite(products: List[Dict[str, Any]], db_file: str) -> str:
+def save_to_sqlite(products: Iterable[Dict[str, Any]], db_file: str) -> str:
     """
     Save the products to a SQLite database.
     
     Args:
-        products: List of product dictionaries
+        products: Iterable of product dictionaries
         db_file: SQLite database filename
         
     Returns:
@@ -71,6 +111,12 @@ def save_to_sqlite(products: List[Dict[str, Any]], db_file: str) -> str:
     conn = sqlite3.connect(file_path)
     cursor = conn.cursor()
     
+    # Tune the connection for bulk writes
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA cache_size=-64000')
+    
     # Create the products table if it doesn't exist
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS products (
@@ -86,17 +132,17 @@ def save_to_sqlite(products: List[Dict[str, Any]], db_file: str) -> str:
     )
     ''')
     
-    # Insert the products
-    for product in products:
-        cursor.execute(
-            'INSERT INTO products (name, brand, price, original_price, discount, url, image_url) VALUES (?, ?, ?, ?, ?, ?, ?)',
-            (product.get('name'), product.get('brand'), product.get('price'), 
-             product.get('original_price'), product.get('discount'), 
-             product.get('url'), product.get('image_url'))
-        )
+    # Index the brand column used by the API's brand filter and brand listing
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_products_brand ON products(brand)')
     
-    # Commit the changes and close the connection
-    conn.commit()
-    conn.close()
+    # Insert the products in a single transaction, so a failure while the
+    # products are still being cleaned leaves no partial scrape behind.
+    # The rows are streamed to executemany one at a time.
+    try:
+        with conn:
+            cursor.executemany(_INSERT_SQL, map(_ROW_GETTER, products))
+    finally:
+        # Close the connection
+        conn.close()
     
     return str(file_path.absolute())
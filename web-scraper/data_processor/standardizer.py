@@ -2,100 +2,131 @@
 Functions for standardizing product data from different sources.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator
 
+# Keys that may hold each standardized field, in order of preference
+FIELD_ALIASES = {
+    'name': ('name', 'title'),
+    'brand': ('brand', 'vendor'),
+    'price': ('price',),
+    'original_price': ('original_price', 'compare_at_price'),
+    'discount': ('discount',),
+    'url': ('url',),
+    'image_url': ('image_url',),
+}
 
-def standardize_products(products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+# Marks a field that none of its aliases provided
+_MISSING = object()
+
+
+def standardize_products(products: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Standardize product data to ensure consistent format.
     
     Args:
         products: List of raw product dictionaries from various sources
-        
+    
     Returns:
         List of standardized product dictionaries
     """
-    standardized = []
+    return list(standardize_products_iter(products))
+
+
+def standardize_products_iter(products: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Standardize product data one product at a time.
     
+    Args:
+        products: Iterable of raw product dictionaries from various sources
+    
+    Yields:
+        Standardized product dictionaries
+    """
     for product in products:
-        std_product = {}
-        
         # Handle different formats of product data
-        if isinstance(product, dict):
-            # Extract name
-            if 'name' in product:
-                std_product['name'] = product['name']
-            elif 'title' in product:
-                std_product['name'] = product['title']
-            else:
-                std_product['name'] = 'Unknown Product'
-                
-            # Extract brand
-            if 'brand' in product:
-                std_product['brand'] = product['brand']
-            elif 'vendor' in product:
-                std_product['brand'] = product['vendor']
-            else:
-                std_product['brand'] = None
-                
-            # Extract price
-            if 'price' in product:
-                std_product['price'] = product['price']
-            elif 'price_min' in product:
+        if not isinstance(product, dict):
+            continue
+        
+        # Copy the fields that only differ by key name
+        std_product = {
+            field: next((product[alias] for alias in aliases if alias in product), _MISSING)
+            for field, aliases in FIELD_ALIASES.items()
+        }
+        
+        # Only add products with at least a real name
+        name = std_product['name']
+        if name is _MISSING or not name or name == 'Unknown Product':
+            continue
+        
+        # Derive the remaining fields from source-specific formats
+        if std_product['brand'] is _MISSING:
+            std_product['brand'] = None
+        if std_product['price'] is _MISSING:
+            if 'price_min' in product:
                 std_product['price'] = str(product['price_min'])
-            elif 'variants' in product and product['variants'] and 'price' in product['variants'][0]:
-                std_product['price'] = product['variants'][0]['price']
-            else:
-                std_product['price'] = None
-                
-            # Extract original price
-            if 'original_price' in product:
-                std_product['original_price'] = product['original_price']
-            elif 'compare_at_price' in product:
-                std_product['original_price'] = product['compare_at_price']
-            elif 'variants' in product and product['variants'] and 'compare_at_price' in product['variants'][0]:
-                std_product['original_price'] = product['variants'][0]['compare_at_price']
-            else:
-                std_product['original_price'] = std_product['price']
-                
-            # Extract discount
-            if 'discount' in product:
-                std_product['discount'] = product['discount']
             else:
-                std_product['discount'] = None
-                
-            # Extract URL
-            if 'url' in product:
-                std_product['url'] = product['url']
-            elif 'handle' in product:
+                std_product['price'] = _variant_value(product, 'price')
+        if std_product['original_price'] is _MISSING:
+            std_product['original_price'] = _variant_value(product, 'compare_at_price', std_product['price'])
+        if std_product['discount'] is _MISSING:
+            std_product['discount'] = None
+        if std_product['url'] is _MISSING:
+            if 'handle' in product:
                 std_product['url'] = f"https://justyol.com/en/products/{product['handle']}"
             else:
                 std_product['url'] = None
-                
-            # Extract image URL
-            if 'image_url' in product:
-                std_product['image_url'] = product['image_url']
-            elif 'image' in product:
-                if isinstance(product['image'], str):
-                    std_product['image_url'] = product['image']
-                elif isinstance(product['image'], dict) and 'src' in product['image']:
-                    std_product['image_url'] = product['image']['src']
-            elif 'featured_image' in product:
-                std_product['image_url'] = product['featured_image']
-            elif 'images' in product and product['images']:
-                if isinstance(product['images'], list) and product['images']:
-                    img = product['images'][0]
-                    if isinstance(img, dict) and 'src' in img:
-                        std_product['image_url'] = img['src']
-                    else:
-                        std_product['image_url'] = str(img)
-                else:
-                    std_product['image_url'] = str(product['images'])
-            else:
-                std_product['image_url'] = None
-                
-            # Only add products with at least a name
-            if std_product['name'] and std_product['name'] != 'Unknown Product':
-                standardized.append(std_product)
-            
-    return standardized
+        if std_product['image_url'] is _MISSING:
+            std_product['image_url'] = _image_url(product)
+        
+        yield std_product
+
+
+def _variant_value(product: Dict[str, Any], key: str, default: Any = None) -> Any:
+    """
+    Get a value from the first variant of a product.
+    
+    Args:
+        product: Raw product dictionary
+        key: Key to look up in the first variant
+        default: Value returned when the variant doesn't have the key
+    
+    Returns:
+        The variant value, or the default
+    """
+    variants = product.get('variants')
+    if variants and key in variants[0]:
+        return variants[0][key]
+    return default
+
+
+def _image_url(product: Dict[str, Any]) -> Any:
+    """
+    Get the image URL from the image fields used by the different sources.
+    
+    Args:
+        product: Raw product dictionary
+    
+    Returns:
+        The image URL, or None if the product has none
+    """
+    if 'image' in product:
+        image = product['image']
+        if isinstance(image, str):
+            return image
+        if isinstance(image, dict) and 'src' in image:
+            return image['src']
+        return None
+    
+    if 'featured_image' in product:
+        return product['featured_image']
+    
+    images = product.get('images')
+    if images:
+        if isinstance(images, list):
+            img = images[0]
+            if isinstance(img, dict) and 'src' in img:
+                return img['src']
+            return str(img)
+        return str(images)
+    
+    return None
@@ -6,13 +6,13 @@ Main entry point for the web scraping application.
 import argparse
 import asyncio
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from scraper.justyol import JustYolScraper
 from scraper.api_scraper import JustYolApiScraper
-from scraper.selenium_scraper import JustYolSeleniumScraper
-from data_processor.cleaner import clean_product_data
-from data_processor.standardizer import standardize_products
+from data_processor.cleaner import clean_product_data, clean_product_data_iter
+from data_processor.standardizer import standardize_products, standardize_products_iter
 from data_processor.output import save_to_csv, save_to_json, save_to_sqlite
 
 # Configure logging
@@ -22,6 +22,140 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of products above which processing is spread across CPU cores
+PARALLEL_THRESHOLD = 5000
+
+def standardize_and_clean(products):
+    """
+    Standardize and clean a list of products.
+    
+    Args:
+        products: List of raw product dictionaries
+        
+    Returns:
+        List of cleaned product dictionaries
+    """
+    return clean_product_data(standardize_products(products))
+
+def process_products(products):
+    """
+    Standardize and clean the scraped products, yielding them lazily.
+    
+    Small product lists are streamed through the standardizer and cleaner
+    in-process. Large ones are split across worker processes, since starting
+    the workers only pays off for multi-thousand-product scrapes.
+    
+    Args:
+        products: List of raw product dictionaries
+        
+    Yields:
+        Cleaned product dictionaries, in the original product order
+    """
+    workers = os.cpu_count() or 1
+    if len(products) < PARALLEL_THRESHOLD or workers < 2:
+        yield from clean_product_data_iter(standardize_products_iter(products))
+        return
+    
+    # Split into contiguous chunks so the output keeps the input order
+    chunk_size = -(-len(products) // workers)
+    chunks = [products[i:i + chunk_size] for i in range(0, len(products), chunk_size)]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for cleaned_chunk in executor.map(standardize_and_clean, chunks):
+            yield from cleaned_chunk
+
+async def scrape_with_api(url, pages):
+    """Scrape the products through the site's JSON APIs."""
+    api_scraper = JustYolApiScraper()
+    return await api_scraper.scrape_products(url)
+
+async def scrape_with_selenium(url, pages):
+    """Scrape the products with Selenium."""
+    # Imported here so runs served by the API never load the browser libraries
+    from scraper.selenium_scraper import JustYolSeleniumScraper
+    
+    selenium_scraper = JustYolSeleniumScraper()
+    return selenium_scraper.scrape_products(url, pages)
+
+async def scrape_with_playwright(url, pages):
+    """Scrape the products with Playwright."""
+    # Imported here so runs served by the API never load the browser libraries
+    from scraper.justyol import JustYolScraper
+    
+    playwright_scraper = JustYolScraper()
+    
+    try:
+        # Start the browser
+        await playwright_scraper.start()
+        
+        # Scrape the products
+        return await playwright_scraper.scrape_products(url, pages)
+    except Exception as e:
+        logger.error(f"An error occurred during Playwright scraping: {e}")
+        return []
+    finally:
+        # Close the browser
+        await playwright_scraper.stop()
+
+# Scraping methods, in the order auto mode tries them by default
+SCRAPERS = {
+    'api': scrape_with_api,
+    'selenium': scrape_with_selenium,
+    'playwright': scrape_with_playwright
+}
+METHOD_NAMES = {'api': 'API', 'selenium': 'Selenium', 'playwright': 'Playwright'}
+
+# File recording the method that worked last, which auto mode tries first
+METHOD_CACHE_FILE = Path.home() / '.cache' / 'justyol_scraper' / 'method'
+
+def load_cached_method():
+    """Return the scraping method that worked last, if one was recorded."""
+    try:
+        method = METHOD_CACHE_FILE.read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    return method if method in SCRAPERS else None
+
+def save_cached_method(method):
+    """Record the scraping method that worked for the next run."""
+    try:
+        METHOD_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        METHOD_CACHE_FILE.write_text(method, encoding='utf-8')
+    except OSError as e:
+        logger.debug(f"Could not save the scraping method: {e}")
+
+async def plan_auto_methods(url):
+    """
+    Decide the order in which auto mode tries the scraping methods.
+    
+    The last method that worked goes first. A quick HEAD request to the
+    products.json endpoint then skips the API tier if the endpoint doesn't
+    exist, or moves it to the front if it does.
+    
+    Args:
+        url: The collection URL
+        
+    Returns:
+        List of method names to try in order
+    """
+    methods = list(SCRAPERS)
+    
+    cached_method = load_cached_method()
+    if cached_method:
+        methods.remove(cached_method)
+        methods.insert(0, cached_method)
+    
+    api_available = await JustYolApiScraper().probe(url)
+    if api_available is False:
+        logger.info("Products API not available, skipping API-based scraping")
+        methods.remove('api')
+    elif api_available:
+        # The API is far cheaper than starting a browser, so try it first
+        methods.remove('api')
+        methods.insert(0, 'api')
+    
+    return methods
+
 async def main():
     """Main function to run the scraper."""
     # Parse command line arguments
@@ -40,72 +174,46 @@ async def main():
                         help='Scraping method to use')
     args = parser.parse_args()
 
-    products = []
+    # Try the specified method, or each method in turn if auto
+    if args.method == 'auto':
+        methods = await plan_auto_methods(args.url)
+    else:
+        methods = [args.method]
     
-    # Try different scraping methods based on the specified method or in sequence if auto
-    if args.method == 'auto' or args.method == 'api':
-        logger.info("Attempting API-based scraping")
-        api_scraper = JustYolApiScraper()
-        api_products = api_scraper.scrape_products(args.url)
-        
-        if api_products and len(api_products) > 3:
-            logger.info(f"Successfully retrieved {len(api_products)} products via API")
-            products = api_products
-        elif args.method == 'api':
-            logger.warning("API-based scraping failed")
-        else:
-            logger.info("API-based scraping failed, trying Selenium")
-    
-    if (args.method == 'auto' and not products) or args.method == 'selenium':
-        logger.info("Attempting Selenium-based scraping")
-        selenium_scraper = JustYolSeleniumScraper()
-        selenium_products = selenium_scraper.scrape_products(args.url, args.pages)
-        
-        if selenium_products and len(selenium_products) > 3:
-            logger.info(f"Successfully retrieved {len(selenium_products)} products via Selenium")
-            products = selenium_products
-        elif args.method == 'selenium':
-            logger.warning("Selenium-based scraping failed")
-        else:
-            logger.info("Selenium-based scraping failed, trying Playwright")
-    
-    if (args.method == 'auto' and not products) or args.method == 'playwright':
-        logger.info("Attempting Playwright-based scraping")
-        playwright_scraper = JustYolScraper()
+    # Auto mode drops the API tier only when the probe found no products.json,
+    # so Playwright will have to render the pages: launch Chromium meanwhile
+    if args.method == 'auto' and methods[0] == 'playwright' and 'api' not in methods:
+        from scraper.justyol import JustYolScraper
+        JustYolScraper.prewarm()
+    
+    products = []
+    for method in methods:
+        name = METHOD_NAMES[method]
+        logger.info(f"Attempting {name}-based scraping")
+        method_products = await SCRAPERS[method](args.url, args.pages)
         
-        try:
-            # Start the browser
-            await playwright_scraper.start()
-            
-            # Scrape the products
-            playwright_products = await playwright_scraper.scrape_products(args.url, args.pages)
-            
-            if playwright_products and len(playwright_products) > 3:
-                logger.info(f"Successfully retrieved {len(playwright_products)} products via Playwright")
-                products = playwright_products
-            else:
-                logger.warning("Playwright-based scraping failed")
-        except Exception as e:
-            logger.error(f"An error occurred during Playwright scraping: {e}")
-        finally:
-            # Close the browser
-            await playwright_scraper.stop()
+        if method_products and len(method_products) > 3:
+            logger.info(f"Successfully retrieved {len(method_products)} products via {name}")
+            products = method_products
+            save_cached_method(method)
+            break
+        logger.warning(f"{name}-based scraping failed")
     
     if not products:
         logger.error("All scraping methods failed")
         return
     
-    # Standardize the product data
-    standardized_products = standardize_products(products)
-    logger.info(f"Standardized {len(standardized_products)} products")
-    
-    # Clean the data
-    cleaned_products = clean_product_data(standardized_products)
-    logger.info("Data cleaning completed")
+    # Standardize and clean the data as it is written out
+    cleaned_products = process_products(products)
     
     # Save the data in requested formats
     output_formats = args.output.split(',')
     
+    # A stream can only be written once, so keep the products for multiple formats
+    if sum(fmt in output_formats for fmt in ('csv', 'json', 'db')) > 1:
+        cleaned_products = list(cleaned_products)
+        logger.info(f"Standardized and cleaned {len(cleaned_products)} products")
+    
     if 'csv' in output_formats:
         csv_path = save_to_csv(cleaned_products, 'products.csv')
         logger.info(f"Data saved to CSV: {csv_path}")
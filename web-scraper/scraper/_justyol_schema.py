@@ -0,0 +1,107 @@
+"""
+Product card schema shared by the browser scrapers.
+
+Both scrapers inject the same extractor into the rendered listing page and
+normalize its output the same way, so the card selectors live in one place.
+"""
+
+from typing import Dict, Any
+
+# Selectors of the product cards, one per card layout, in order of preference
+CARD_SELECTORS = ['.product-card', 'div.hdt-card-product']
+# Matches the product cards of any layout, for waiting until the grid is loaded
+CARD_SELECTOR = ', '.join(CARD_SELECTORS)
+
+# Selectors of each field read from a product card, in order of preference.
+# Alternatives from different card layouts are a single CSS union instead.
+# .sale-price sits inside .product-card-price, so those two must stay ordered.
+# Lists rather than tuples, since Playwright only serializes lists and dicts.
+SELECTORS = {
+    "cards": CARD_SELECTORS,
+    "name": [".product-card-title, a.hdt-card-product__title"],
+    "brand": [".product-card-vendor"],
+    "url": ["a.product-card-image-wrapper", "a.hdt-card-product__title", "a"],
+    "price": [".sale-price", ".product-card-price"],
+    "original_price": [".compare-at-price"],
+    "discount": [".product-card-badge.sale"],
+    "image_url": ["img.product-card-image", "img"]
+}
+
+# Collects the raw fields of every product card on the page in one round trip.
+# Takes SELECTORS as its argument and skips the cards without a name.
+PAGE_JS_EXTRACTOR = """
+selectors => {
+    const cardSelector = selectors.cards.find(s => document.querySelector(s));
+    if (!cardSelector) return [];
+    
+    const products = [];
+    for (const card of document.querySelectorAll(cardSelector)) {
+        const find = field => {
+            for (const selector of selectors[field]) {
+                const el = card.querySelector(selector);
+                if (el) return el;
+            }
+            return null;
+        };
+        const text = field => find(field)?.textContent.trim() || null;
+        const img = find('image_url');
+        
+        const name = text('name');
+        if (!name) continue;
+        products.push({
+            name: name,
+            brand: text('brand'),
+            price: text('price'),
+            original_price: text('original_price'),
+            discount: text('discount'),
+            url: find('url')?.getAttribute('href') || null,
+            image_url: img ? img.getAttribute('src') || img.getAttribute('data-src') : null
+        });
+    }
+    return products;
+}
+"""
+
+# Completes the relative product URLs and protocol-relative image URLs
+_BASE_URL = "https://justyol.com"
+_HTTPS_PREFIX = "https:"
+
+
+def normalize(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Turn the fields the page extractor read from a card into a product.
+    
+    Args:
+        raw: One product returned by PAGE_JS_EXTRACTOR
+    
+    Returns:
+        A dictionary containing product information
+    """
+    return {
+        'name': raw['name'],
+        'brand': raw['brand'],
+        'price': raw['price'],
+        'original_price': raw['original_price'] if raw['original_price'] is not None else raw['price'],
+        'discount': raw['discount'],
+        'url': _absolute_url(raw['url']),
+        'image_url': _absolute_url(raw['image_url'])
+    }
+
+
+def _absolute_url(url: Any) -> Any:
+    """
+    Complete a relative or protocol-relative URL on the JustYol site.
+    
+    Args:
+        url: The URL as written in the page, or None
+    
+    Returns:
+        The absolute URL, or None if there was no URL
+    """
+    if not url:
+        return None
+    if url.startswith('//'):
+        return _HTTPS_PREFIX + url
+    if url.startswith('/'):
+        return _BASE_URL + url
+    return url
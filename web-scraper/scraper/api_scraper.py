@@ -2,203 +2,248 @@
 API-based scraper for JustYol.
 """
 
+import asyncio
 import logging
-import requests
+import httpx
+import orjson
 import json
-import re
 from typing import List, Dict, Any, Optional
 
+from scraper.products_json import COLLECTION_RE, HEADERS
+
 logger = logging.getLogger(__name__)
 
+# Server errors worth retrying, and the retry count and base backoff in seconds
+_RETRY_STATUSES = (500, 502, 503, 504)
+_RETRIES = 2
+_RETRY_BACKOFF = 0.2
+
+# GraphQL query for a collection's products, with a slot for the handle
+_GRAPHQL_QUERY = """
+{
+  collection(handle: "%s") {
+    products(first: 250) {
+      edges {
+        node {
+          id
+          title
+          handle
+          priceRange {
+            minVariantPrice {
+              amount
+              currencyCode
+            }
+          }
+          images(first: 1) {
+            edges {
+              node {
+                originalSrc
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
 class JustYolApiScraper:
     """Scraper that uses direct API access to retrieve JustYol product data."""
     
     def __init__(self):
         """Initialize the API scraper."""
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36",
-            "Accept": "application/json",
-            "Referer": "https://justyol.com/en/collections/women-handbags"
-        }
+        self.headers = {**HEADERS, "Referer": "https://justyol.com/en/collections/women-handbags"}
+        self._graphql_headers = {**self.headers, "Content-Type": "application/json"}
     
-    def scrape_products(self, url: str) -> List[Dict[str, Any]]:
+    async def scrape_products(self, url: str) -> List[Dict[str, Any]]:
         """
         Scrape product information using various API approaches.
         
+        All candidate endpoints are requested concurrently over one HTTP/2
+        connection, and the first one in order of preference that returns
+        products wins.
+        
         Args:
             url: The collection URL
             
         Returns:
             A list of dictionaries containing product information
         """
-        # Try all methods one by one
-        products = self._get_api_data(url)
-        if products and len(products) > 3:
-            logger.info(f"Successfully retrieved {len(products)} products via direct API")
-            return products
-            
-        products = self._try_inventory_api(url)
-        if products and len(products) > 3:
-            logger.info(f"Successfully retrieved {len(products)} products via inventory API")
-            return products
-            
-        products = self._try_graphql_approach(url)
-        if products and len(products) > 3:
-            logger.info(f"Successfully retrieved {len(products)} products via GraphQL")
-            return products
+        # Extract collection handle from URL
+        collection_match = COLLECTION_RE.search(url)
+        if not collection_match:
+            logger.warning("All API approaches failed")
+            return []
+            
+        collection = collection_match.group(1)
+        
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8),
+            retries=_RETRIES
+        )
+        async with httpx.AsyncClient(transport=transport, headers=self.headers, follow_redirects=True) as client:
+            # Start every approach at once so the network round trips overlap
+            tasks = [
+                ("direct API", asyncio.create_task(self._fetch_products(client, api_url)))
+                for api_url in self._api_urls(collection)
+            ]
+            tasks += [
+                ("inventory API", asyncio.create_task(self._fetch_products(client, inventory_url)))
+                for inventory_url in self._inventory_urls(collection)
+            ]
+            tasks.append(("GraphQL", asyncio.create_task(self._try_graphql_approach(client, collection))))
+            
+            try:
+                # Take the results in order of preference
+                for source, task in tasks:
+                    products = await task
+                    if products and len(products) > 3:
+                        logger.info(f"Successfully retrieved {len(products)} products via {source}")
+                        return products
+            finally:
+                # Drop the requests that are no longer needed before the client closes
+                for _, task in tasks:
+                    task.cancel()
+                await asyncio.gather(*(task for _, task in tasks), return_exceptions=True)
             
         logger.warning("All API approaches failed")
         return []
     
-    def _get_api_data(self, url: str) -> Optional[List[Dict[str, Any]]]:
+    async def probe(self, url: str) -> Optional[bool]:
         """
-        Attempt to directly access the API if possible.
+        Check cheaply whether the collection's products.json endpoint exists.
         
         Args:
             url: The collection URL
             
         Returns:
-            A list of product dictionaries if successful, None otherwise
+            True if the endpoint answered 200, False if it answered 404,
+            None if the probe was inconclusive
         """
-        try:
-            # Extract collection handle from URL
-            collection_match = re.search(r'collections/([a-zA-Z0-9-]+)', url)
-            if not collection_match:
-                return None
-                
-            collection = collection_match.group(1)
-            
-            # Try different API endpoints that might return product data
-            api_urls = [
-                f"https://justyol.com/api/collections/{collection}/products.json?limit=250",
-                f"https://justyol.com/en/collections/{collection}/products.json?limit=250",
-                f"https://justyol.com/collections/{collection}/products.json?limit=250"
-            ]
+        collection_match = COLLECTION_RE.search(url)
+        if not collection_match:
+            return False
             
-            for api_url in api_urls:
-                try:
-                    logger.info(f"Trying API URL: {api_url}")
-                    response = requests.get(api_url, headers=self.headers, timeout=10)
-                    if response.status_code == 200:
-                        try:
-                            data = response.json()
-                            if 'products' in data:
-                                return data['products']
-                        except:
-                            pass
-                except:
-                    continue
-                    
-            return None
-        except Exception as e:
-            logger.error(f"API approach failed: {str(e)}")
+        probe_url = f"https://justyol.com/collections/{collection_match.group(1)}/products.json"
+        try:
+            async with httpx.AsyncClient(headers=self.headers, follow_redirects=True) as client:
+                response = await client.head(probe_url, timeout=2)
+        except httpx.HTTPError as e:
+            logger.debug(f"API probe failed: {e}")
             return None
+            
+        if response.status_code == 200:
+            return True
+        if response.status_code == 404:
+            return False
+        return None
     
-    def _try_inventory_api(self, url: str) -> Optional[List[Dict[str, Any]]]:
+    def _api_urls(self, collection: str) -> List[str]:
         """
-        Try to access inventory API endpoints which may contain product data.
+        Build the API endpoints that might return the collection's product data.
         
         Args:
-            url: The collection URL
+            collection: The collection handle
+            
+        Returns:
+            A list of API URLs
+        """
+        return [
+            f"https://justyol.com/api/collections/{collection}/products.json?limit=250",
+            f"https://justyol.com/en/collections/{collection}/products.json?limit=250",
+            f"https://justyol.com/collections/{collection}/products.json?limit=250"
+        ]
+    
+    def _inventory_urls(self, collection: str) -> List[str]:
+        """
+        Build the inventory API endpoints which may contain product data.
+        
+        Args:
+            collection: The collection handle
+            
+        Returns:
+            A list of inventory API URLs
+        """
+        return [
+            "https://justyol.com/en/products.json?limit=250",
+            f"https://justyol.com/api/inventory/products?collection={collection}&limit=250",
+            f"https://justyol.com/en/recommendations/products.json?collection={collection}&limit=250"
+        ]
+    
+    async def _fetch_products(self, client: httpx.AsyncClient, api_url: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch the product list from a JSON endpoint.
+        
+        Args:
+            client: The HTTP client shared by the scrape
+            api_url: The endpoint URL
             
         Returns:
             A list of product dictionaries if successful, None otherwise
         """
+        logger.info(f"Trying API URL: {api_url}")
         try:
-            # Extract collection handle from URL
-            collection_match = re.search(r'collections/([a-zA-Z0-9-]+)', url)
-            if not collection_match:
+            response = await self._request(client, "GET", api_url, timeout=10)
+        except httpx.HTTPError as e:
+            logger.debug(f"API URL {api_url} failed: {e}")
+            return None
+            
+        if response.status_code == 200:
+            try:
+                data = orjson.loads(response.content)
+            except orjson.JSONDecodeError as e:
+                logger.debug(f"API URL {api_url} returned invalid JSON: {e}")
                 return None
-                
-            collection = collection_match.group(1)
-            
-            # Some common inventory API endpoints
-            inventory_urls = [
-                "https://justyol.com/en/products.json?limit=250",
-                f"https://justyol.com/api/inventory/products?collection={collection}&limit=250",
-                f"https://justyol.com/en/recommendations/products.json?collection={collection}&limit=250"
-            ]
+            if isinstance(data, dict) and 'products' in data:
+                return data['products']
             
-            for inventory_url in inventory_urls:
-                try:
-                    logger.info(f"Trying inventory API: {inventory_url}")
-                    response = requests.get(inventory_url, headers=self.headers, timeout=10)
-                    if response.status_code == 200:
-                        try:
-                            data = response.json()
-                            if 'products' in data:
-                                return data['products']
-                        except:
-                            pass
-                except:
-                    continue
-                    
-            return None
-        except Exception as e:
-            logger.error(f"Inventory API approach failed: {str(e)}")
-            return None
+        return None
     
-    def _try_graphql_approach(self, url: str) -> Optional[List[Dict[str, Any]]]:
+    async def _request(self, client: httpx.AsyncClient, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request, retrying with backoff on transient server errors.
+        
+        Connection failures are already retried by the client's transport.
+        
+        Args:
+            client: The HTTP client shared by the scrape
+            method: The HTTP method
+            url: The request URL
+            **kwargs: Extra arguments for the request
+            
+        Returns:
+            The last response received
+        """
+        for attempt in range(_RETRIES + 1):
+            response = await client.request(method, url, **kwargs)
+            if response.status_code not in _RETRY_STATUSES or attempt == _RETRIES:
+                return response
+            await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+    
+    async def _try_graphql_approach(self, client: httpx.AsyncClient, collection: str) -> Optional[List[Dict[str, Any]]]:
         """
         Try to use GraphQL if the site uses it.
         
         Args:
-            url: The collection URL
+            client: The HTTP client shared by the scrape
+            collection: The collection handle
             
         Returns:
             A list of product dictionaries if successful, None otherwise
         """
         try:
-            # Extract collection handle from URL
-            collection_match = re.search(r'collections/([a-zA-Z0-9-]+)', url)
-            if not collection_match:
-                return None
-                
-            collection = collection_match.group(1)
-            
-            # Update headers for GraphQL
-            graphql_headers = self.headers.copy()
-            graphql_headers["Content-Type"] = "application/json"
-            
             # Common GraphQL endpoint
             graphql_url = "https://justyol.com/api/graphql"
             
             # Query for products
-            query = {
-                "query": f"""
-                {{
-                  collection(handle: "{collection}") {{
-                    products(first: 250) {{
-                      edges {{
-                        node {{
-                          id
-                          title
-                          handle
-                          priceRange {{
-                            minVariantPrice {{
-                              amount
-                              currencyCode
-                            }}
-                          }}
-                          images(first: 1) {{
-                            edges {{
-                              node {{
-                                originalSrc
-                              }}
-                            }}
-                          }}
-                        }}
-                      }}
-                    }}
-                  }}
-                }}
-                """
-            }
+            query = {"query": _GRAPHQL_QUERY % collection}
             
             logger.info(f"Trying GraphQL approach")
-            response = requests.post(graphql_url, headers=graphql_headers, json=query, timeout=15)
+            response = await self._request(client, "POST", graphql_url, headers=self._graphql_headers, json=query, timeout=15)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if 'data' in data and 'collection' in data['data'] and 'products' in data['data']['collection']:
                     products = []
                     for edge in data['data']['collection']['products']['edges']:
@@ -219,6 +264,6 @@ class JustYolApiScraper:
                     return products
             
             return None
-        except Exception as e:
+        except (httpx.HTTPError, ValueError, KeyError, TypeError) as e:
             logger.error(f"GraphQL approach failed: {str(e)}")
             return None
@@ -0,0 +1,44 @@
+"""
+Helpers for running scraping tasks concurrently.
+"""
+
+import asyncio
+import os
+from collections import deque
+from typing import AsyncIterator, Awaitable, Deque, Iterable, TypeVar
+
+T = TypeVar('T')
+
+# Default number of tasks kept in flight at once
+DEFAULT_LIMIT = max(2, os.cpu_count() or 1)
+
+
+async def bounded_iter(coros: Iterable[Awaitable[T]], limit: int = DEFAULT_LIMIT) -> AsyncIterator[T]:
+    """
+    Run awaitables concurrently, with at most `limit` of them in flight,
+    yielding each result in order as soon as it and every earlier one are done.
+    
+    Unlike asyncio.gather, the awaitables are taken from the iterable only as
+    earlier ones finish, so a generator of coroutines is never started all at once.
+    Closing the generator early cancels the awaitables still running.
+    
+    Args:
+        coros: The awaitables to run
+        limit: Maximum number of awaitables running at the same time
+    
+    Yields:
+        The results, in the order of the awaitables
+    """
+    pending: Deque[asyncio.Future] = deque()
+    try:
+        for coro in coros:
+            pending.append(asyncio.ensure_future(coro))
+            if len(pending) >= limit:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        # Let the cancelled tasks finish their cleanup before returning
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
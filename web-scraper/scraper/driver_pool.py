@@ -0,0 +1,168 @@
+"""
+Pool of reusable Selenium drivers.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+
+class ChromeDriverPool:
+    """
+    Keeps started Chrome drivers around so scrapes don't pay the browser
+    start-up cost every time.
+
+    Idle drivers are handed out most recently used first. A driver is
+    replaced after max_uses scrapes and closed once it has been idle for
+    idle_timeout seconds.
+    """
+
+    def __init__(self, create_driver: Callable[[], webdriver.Chrome], max_size: int = 2,
+                 max_uses: int = 20, idle_timeout: float = 300.0):
+        """
+        Initialize the pool.
+
+        Args:
+            create_driver: Function that starts a new driver
+            max_size: Maximum number of drivers alive at once
+            max_uses: Number of scrapes after which a driver is replaced
+            idle_timeout: Seconds an unused driver is kept before it is closed
+        """
+        self.create_driver = create_driver
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.idle_timeout = idle_timeout
+
+        # Idle drivers as (driver, uses, released_at), most recently used last
+        self._idle: List[Tuple[webdriver.Chrome, int, float]] = []
+        # Use counts of the drivers currently handed out
+        self._in_use: Dict[webdriver.Chrome, int] = {}
+        self._size = 0
+        self._condition = threading.Condition()
+
+        threading.Thread(target=self._close_idle_drivers, daemon=True).start()
+
+    def acquire(self) -> webdriver.Chrome:
+        """
+        Get a driver, starting one if none is idle and the pool isn't full.
+
+        Returns:
+            A driver reserved for the caller until it is released
+        """
+        with self._condition:
+            while True:
+                while self._idle:
+                    driver, uses, _ = self._idle.pop()
+                    if self._is_alive(driver):
+                        self._in_use[driver] = uses
+                        return driver
+                    self._size -= 1
+                    self._quit(driver)
+
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+
+                # Wait for another scrape to release its driver
+                self._condition.wait()
+
+        # Start the browser outside the lock since it takes a while
+        try:
+            driver = self.create_driver()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._in_use[driver] = 0
+        return driver
+
+    def release(self, driver: webdriver.Chrome) -> None:
+        """
+        Return a driver to the pool, or close it if it has been used up.
+
+        Args:
+            driver: A driver obtained from acquire
+        """
+        with self._condition:
+            uses = self._in_use.pop(driver) + 1
+            self._condition.notify()
+            if uses < self.max_uses:
+                self._idle.append((driver, uses, time.monotonic()))
+                return
+            self._size -= 1
+
+        self._quit(driver)
+
+    def close(self) -> None:
+        """Close all idle drivers."""
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._condition.notify_all()
+
+        for driver, _, _ in idle:
+            self._quit(driver)
+
+    def _close_idle_drivers(self) -> None:
+        """Periodically close the drivers that have been idle too long."""
+        while True:
+            time.sleep(self.idle_timeout / 2)
+            with self._condition:
+                cutoff = time.monotonic() - self.idle_timeout
+                expired = [entry for entry in self._idle if entry[2] < cutoff]
+                self._idle = [entry for entry in self._idle if entry[2] >= cutoff]
+                self._size -= len(expired)
+                self._condition.notify_all()
+
+            for driver, _, _ in expired:
+                logger.info("Closing idle browser")
+                self._quit(driver)
+
+    @staticmethod
+    def _is_alive(driver: webdriver.Chrome) -> bool:
+        """Check that a driver's browser still responds."""
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _quit(driver: webdriver.Chrome) -> None:
+        """Close a driver, ignoring browsers that already went away."""
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+
+# Shared pools, keyed by whether their browsers run headless
+_POOLS: Dict[bool, ChromeDriverPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_driver_pool(headless: bool, create_driver: Callable[[], webdriver.Chrome]) -> ChromeDriverPool:
+    """
+    Get the shared driver pool for headless or headed browsers.
+
+    Args:
+        headless: Whether the pool's browsers run headless
+        create_driver: Function that starts a new driver, used when the pool is first created
+
+    Returns:
+        The shared pool
+    """
+    with _POOLS_LOCK:
+        if headless not in _POOLS:
+            _POOLS[headless] = ChromeDriverPool(create_driver)
+            atexit.register(_POOLS[headless].close)
+        return _POOLS[headless]
@@ -4,42 +4,179 @@ JustYol-specific implementation of the BaseScraper.
 
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional
-from playwright.async_api import async_playwright, Page
+from pathlib import Path
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
+import httpx
+from playwright.async_api import async_playwright, Browser, Page, Playwright, Route
 
 from scraper.base import BaseScraper
+from scraper import products_json, _justyol_schema
+from scraper.concurrency import bounded_iter, DEFAULT_LIMIT
 
 logger = logging.getLogger(__name__)
 
+# Longest wait for the product cards after the document has loaded, in milliseconds
+_CARD_TIMEOUT_MS = 10000
+
+# Requests the scraper doesn't need, aborted to speed up page loads
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+_BLOCKED_URL_PARTS = ("google-analytics.com", "googletagmanager.com", "facebook.net", "facebook.com", "hotjar.com")
+
+# Cookies and local storage kept between runs, so later runs reuse the site's session
+STORAGE_STATE_FILE = Path.home() / '.cache' / 'justyol_scraper' / 'storage_state.json'
+
+# Browser launch started ahead of time by JustYolScraper.prewarm, as (headless, task)
+_WARM: Optional[Tuple[bool, "asyncio.Task[Tuple[Playwright, Browser]]"]] = None
+
+
+async def _launch_browser(headless: bool) -> Tuple[Playwright, Browser]:
+    """
+    Start Playwright and launch Chromium.
+    
+    Args:
+        headless: Whether to run the browser in headless mode
+    
+    Returns:
+        The Playwright instance and the browser
+    """
+    playwright = await async_playwright().start()
+    try:
+        return playwright, await playwright.chromium.launch(headless=headless)
+    except Exception:
+        await playwright.stop()
+        raise
+
+
+def _take_warm_browser(headless: bool) -> Optional["asyncio.Task[Tuple[Playwright, Browser]]"]:
+    """
+    Claim the prewarmed browser launch, if there is one in the requested mode.
+    
+    Args:
+        headless: Whether the browser has to run in headless mode
+    
+    Returns:
+        The launch task, or None if no matching browser was prewarmed
+    """
+    global _WARM
+    if _WARM is None or _WARM[0] != headless:
+        return None
+    task = _WARM[1]
+    _WARM = None
+    return task
+
+
 class JustYolScraper(BaseScraper):
     """Scraper for JustYol product listings."""
     
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, concurrency: int = DEFAULT_LIMIT):
         """
         Initialize the JustYol scraper.
         
         Args:
             headless: Whether to run the browser in headless mode
+            concurrency: Maximum number of pages to load at the same time
         """
         self.headless = headless
+        self.concurrency = concurrency
         self.browser = None
         self.context = None
+        self._http = None
+        self._browser_lock = asyncio.Lock()
+    
+    @classmethod
+    def prewarm(cls, headless: bool = True) -> None:
+        """
+        Start launching a browser in the background, for the next scraper that needs one.
+        
+        Must be called from a running event loop. The launch then overlaps
+        with whatever the program does before the first page is rendered.
+        
+        Args:
+            headless: Whether to run the browser in headless mode
+        """
+        global _WARM
+        if _WARM is None:
+            _WARM = (headless, asyncio.create_task(_launch_browser(headless)))
     
     async def start(self) -> None:
-        """Start the browser and create a new context."""
-        logger.info("Starting browser")
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=self.headless)
-        self.context = await self.browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        """
+        Open the HTTP client used for products.json.
+        
+        The browser is only started once a scrape needs to render pages,
+        so collections served by products.json never launch Chromium.
+        """
+        # Kept open so every products.json request reuses the same connections
+        self._http = httpx.AsyncClient(
+            headers=products_json.HEADERS,
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(max_connections=16, keepalive_expiry=60)
         )
     
+    async def _start_browser(self) -> None:
+        """Start the browser and create a new context, unless already started."""
+        async with self._browser_lock:
+            if self.context:
+                return
+            
+            logger.info("Starting browser")
+            warm_browser = _take_warm_browser(self.headless)
+            if warm_browser:
+                self.playwright, self.browser = await warm_browser
+            else:
+                self.playwright, self.browser = await _launch_browser(self.headless)
+            user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+            try:
+                self.context = await self.browser.new_context(
+                    user_agent=user_agent,
+                    storage_state=STORAGE_STATE_FILE if STORAGE_STATE_FILE.is_file() else None
+                )
+            except Exception as e:
+                # An unreadable state file shouldn't break every later run, stop() replaces it
+                logger.warning(f"Could not load the browser storage state, starting without it: {e}")
+                self.context = await self.browser.new_context(user_agent=user_agent)
+            await self.context.route("**/*", self._block_unneeded_requests)
+    
     async def stop(self) -> None:
         """Close the browser and clean up resources."""
+        if self._http:
+            await self._http.aclose()
+        if self.context:
+            try:
+                # Write a temporary file first so an interrupted run can't leave a truncated state
+                STORAGE_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                temp_file = STORAGE_STATE_FILE.with_suffix('.tmp')
+                await self.context.storage_state(path=temp_file)
+                temp_file.replace(STORAGE_STATE_FILE)
+            except Exception as e:
+                logger.debug(f"Could not save the browser storage state: {e}")
         if self.browser:
             logger.info("Closing browser")
             await self.browser.close()
             await self.playwright.stop()
+        
+        # Close a prewarmed browser that no scrape ended up needing
+        warm_browser = _take_warm_browser(self.headless)
+        if warm_browser:
+            try:
+                playwright, browser = await warm_browser
+                await browser.close()
+                await playwright.stop()
+            except Exception as e:
+                logger.debug(f"Prewarmed browser failed to start: {e}")
+    
+    async def _block_unneeded_requests(self, route: Route) -> None:
+        """
+        Abort requests for page assets and trackers, letting everything else through.
+        
+        Args:
+            route: The intercepted request
+        """
+        request = route.request
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(part in request.url for part in _BLOCKED_URL_PARTS):
+            await route.abort()
+        else:
+            await route.continue_()
     
     async def scrape_products(self, url: str, pages: int = 1) -> List[Dict[str, Any]]:
         """
@@ -52,35 +189,79 @@ class JustYolScraper(BaseScraper):
         Returns:
             A list of dictionaries containing product information
         """
-        products = []
-        page = await self.context.new_page()
-        
-        # Navigate to the initial URL
-        await page.goto(url, wait_until="networkidle")
-        logger.info(f"Navigated to {url}")
+        return [product async for product in self.stream_products(url, pages)]
+    
+    async def stream_products(self, url: str, pages: int = 1) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Scrape product information from JustYol search results, yielding the
+        products of each page as soon as it and the pages before it are done.
         
-        # Scrape the specified number of pages
-        for i in range(pages):
-            logger.info(f"Scraping page {i+1} of {pages}")
-            
-            # Extract products from the current page
-            page_products = await self._extract_products(page)
-            products.extend(page_products)
+        Args:
+            url: The JustYol collection URL
+            pages: Number of pages to scrape
             
-            # Go to the next page if not on the last page
-            if i < pages - 1:
-                has_next = await self._go_to_next_page(page)
-                if not has_next:
+        Yields:
+            Dictionaries containing product information
+        """
+        # Read the endpoint the page loads its products from, skipping rendering
+        json_pages = products_json.stream_pages(self._http, url, pages)
+        try:
+            page = 0
+            async for page_products in json_pages:
+                page += 1
+                logger.info(f"Retrieved page {page} of {pages} from products.json")
+                for product in page_products:
+                    yield product
+        finally:
+            await json_pages.aclose()
+        if page:
+            return
+        logger.info("products.json unavailable, falling back to the rendered pages")
+        await self._start_browser()
+        
+        # Fetch the listing pages concurrently, in separate tabs of the shared context
+        page_urls = [
+            f"{url}?page={i}" if "?" not in url else f"{url}&page={i}"
+            for i in range(1, pages + 1)
+        ]
+        results = bounded_iter((self._scrape_page(page_url) for page_url in page_urls), self.concurrency)
+        
+        # Keep the pages up to the first one without products
+        try:
+            page = 0
+            async for page_products in results:
+                if not page_products:
                     logger.info("No more pages available")
                     break
-                
-                # Wait for the page to load
-                await page.wait_for_load_state("networkidle")
-                
-                # Add a delay to avoid being blocked
-                await asyncio.sleep(2)
+                page += 1
+                logger.info(f"Scraped page {page} of {pages}")
+                for product in page_products:
+                    yield product
+        finally:
+            # Stop loading the later pages once the first empty one is found
+            await results.aclose()
+    
+    async def _scrape_page(self, page_url: str) -> List[Dict[str, Any]]:
+        """
+        Open a listing page in a new tab and extract its products.
         
-        return products
+        Args:
+            page_url: The URL of the listing page
+            
+        Returns:
+            A list of dictionaries containing product information, empty if
+            the page couldn't be scraped
+        """
+        page = await self.context.new_page()
+        try:
+            await page.goto(page_url, wait_until="domcontentloaded")
+            logger.info(f"Navigated to {page_url}")
+            return await self._extract_products(page)
+        except Exception as e:
+            logger.warning(f"Error scraping page {page_url}: {e}")
+            return []
+        finally:
+            await page.close()
     
     async def _extract_products(self, page: Page) -> List[Dict[str, Any]]:
         """
@@ -92,96 +273,12 @@ class JustYolScraper(BaseScraper):
         Returns:
             A list of dictionaries containing product information
         """
-        products = []
-        
-        # Wait for the product grid to load
-        await page.wait_for_selector('.product-card', timeout=10000)
-        
-        # Get all product elements
-        product_elements = await page.query_selector_all('.product-card')
+        # Wait for the product grid to be in the DOM, it doesn't need to be rendered
+        await page.wait_for_selector(_justyol_schema.CARD_SELECTOR, state="attached", timeout=_CARD_TIMEOUT_MS)
         
-        for element in product_elements:
-            try:
-                # Extract product name
-                name_element = await element.query_selector('.product-card-title')
-                name = await name_element.inner_text() if name_element else None
-                
-                # Extract brand
-                brand_element = await element.query_selector('.product-card-vendor')
-                brand = await brand_element.inner_text() if brand_element else None
-                
-                # Extract product URL
-                url_element = await element.query_selector('a.product-card-image-wrapper')
-                relative_url = await url_element.get_attribute('href') if url_element else None
-                product_url = f"https://justyol.com{relative_url}" if relative_url else None
-                
-                # Extract current price
-                price_element = await element.query_selector('.product-card-price .sale-price')
-                price = await price_element.inner_text() if price_element else None
-                
-                # Extract original price
-                original_price_element = await element.query_selector('.product-card-price .compare-at-price')
-                original_price = await original_price_element.inner_text() if original_price_element else price
-                
-                # Extract discount percentage
-                discount_element = await element.query_selector('.product-card-badge.sale')
-                discount = await discount_element.inner_text() if discount_element else None
-                
-                # Extract image URL
-                img_element = await element.query_selector('img.product-card-image')
-                img_url = await img_element.get_attribute('src') if img_element else None
-                if img_url and img_url.startswith('//'):
-                    img_url = f"https:{img_url}"
-                
-                # Only add products with at least a name
-                if name:
-                    products.append({
-                        'name': name,
-                        'brand': brand,
-                        'price': price,
-                        'original_price': original_price,
-                        'discount': discount,
-                        'url': product_url,
-                        'image_url': img_url
-                    })
-            except Exception as e:
-                logger.warning(f"Error extracting product: {e}")
-                continue
+        # Read every product card in a single call into the page
+        raws = await page.evaluate(_justyol_schema.PAGE_JS_EXTRACTOR, _justyol_schema.SELECTORS)
+        products = [_justyol_schema.normalize(raw) for raw in raws]
         
         logger.info(f"Extracted {len(products)} products from the current page")
         return products
-    
-    async def _go_to_next_page(self, page: Page) -> bool:
-        """
-        Navigate to the next page of results.
-        
-        Args:
-            page: The Playwright page object
-            
-        Returns:
-            True if successfully navigated to the next page, False otherwise
-        """
-        try:
-            # Look for the "Next" button
-            next_button = await page.query_selector('a.pagination__item--next')
-            
-            if next_button:
-                # Check if the button is disabled
-                is_disabled = await next_button.get_attribute('aria-disabled')
-                if is_disabled == 'true':
-                    return False
-                
-                # Click the next button
-                await next_button.click()
-                return True
-            else:
-                # Try alternative pagination if the standard one isn't found
-                load_more_button = await page.query_selector('button.load-more')
-                if load_more_button:
-                    await load_more_button.click()
-                    return True
-                
-                return False
-        except Exception as e:
-            logger.warning(f"Error navigating to next page: {e}")
-            return False
@@ -0,0 +1,142 @@
+"""
+Direct access to JustYol's paginated products.json endpoint.
+
+The collection pages load their products from this endpoint, so reading it
+directly gives the browser scrapers the same data without rendering a page.
+"""
+
+import logging
+import re
+from typing import List, Dict, Any, AsyncIterator, Optional
+
+import httpx
+import orjson
+
+from scraper.concurrency import bounded_iter
+
+logger = logging.getLogger(__name__)
+
+# Matches the collection handle in a collection URL
+COLLECTION_RE = re.compile(r'collections/([a-zA-Z0-9-]+)')
+
+# One page of a collection's products
+PRODUCTS_JSON_URL = "https://justyol.com/collections/{collection}/products.json?page={page}"
+
+# Headers for JSON requests to the site, shared with the API scraper
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36",
+    "Accept": "application/json"
+}
+
+
+def page_urls(url: str, pages: int) -> List[str]:
+    """
+    Build the products.json URLs for the first pages of a collection.
+    
+    Args:
+        url: The collection URL
+        pages: Number of pages
+    
+    Returns:
+        A list of page URLs, empty if the URL isn't a collection URL
+    """
+    collection_match = COLLECTION_RE.search(url)
+    if not collection_match:
+        return []
+    
+    collection = collection_match.group(1)
+    return [PRODUCTS_JSON_URL.format(collection=collection, page=page) for page in range(1, pages + 1)]
+
+
+def parse_products(content: bytes) -> Optional[List[Dict[str, Any]]]:
+    """
+    Parse a products.json response into the scrapers' product format.
+    
+    Args:
+        content: The raw response body
+    
+    Returns:
+        A list of product dictionaries, or None if the body isn't a product listing
+    """
+    try:
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get('products'), list):
+        return None
+    
+    products = []
+    for product in data['products']:
+        variants = product.get('variants') or [{}]
+        images = product.get('images') or [{}]
+        price = variants[0].get('price')
+        products.append({
+            'name': product.get('title'),
+            'brand': product.get('vendor'),
+            'price': price,
+            'original_price': variants[0].get('compare_at_price') or price,
+            'discount': None,
+            'url': f"https://justyol.com/en/products/{product['handle']}" if product.get('handle') else None,
+            'image_url': images[0].get('src')
+        })
+    return products
+
+
+async def stream_pages(client: httpx.AsyncClient, url: str, pages: int) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Fetch the first pages of a collection concurrently, a few at a time,
+    yielding each page's products as soon as it and the pages before it are done.
+    
+    Args:
+        client: The HTTP client to send the requests with
+        url: The collection URL
+        pages: Number of pages to fetch
+    
+    Yields:
+        The products of each page up to the first failed or empty one
+    """
+    async def fetch_page(page_url: str) -> Optional[List[Dict[str, Any]]]:
+        try:
+            response = await client.get(page_url, timeout=10)
+        except httpx.HTTPError as e:
+            logger.debug(f"Products JSON request failed: {e}")
+            return None
+        if response.status_code != 200:
+            return None
+        return parse_products(response.content)
+    
+    results = bounded_iter(fetch_page(page_url) for page_url in page_urls(url, pages))
+    try:
+        async for page_products in results:
+            if not page_products:
+                break
+            yield page_products
+    finally:
+        # Stop requesting the later pages once the first empty one is found
+        await results.aclose()
+
+
+def fetch_products_sync(client: httpx.Client, url: str, pages: int) -> List[Dict[str, Any]]:
+    """
+    Fetch the first pages of a collection one after another.
+    
+    Args:
+        client: The HTTP client to send the requests with
+        url: The collection URL
+        pages: Number of pages to fetch
+    
+    Returns:
+        The products of every page up to the first failed or empty one
+    """
+    products = []
+    for page_url in page_urls(url, pages):
+        try:
+            response = client.get(page_url, timeout=10)
+        except httpx.HTTPError as e:
+            logger.debug(f"Products JSON request failed: {e}")
+            break
+        page_products = parse_products(response.content) if response.status_code == 200 else None
+        if not page_products:
+            break
+        products.extend(page_products)
+    return products
@@ -2,12 +2,14 @@
 Selenium-based scraper for JustYol.
 """
 
+import atexit
 import logging
-import time
 import json
 import re
 from typing import List, Dict, Any
+import httpx
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -15,8 +17,28 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 
+from scraper import products_json, _justyol_schema
+from scraper.driver_pool import get_driver_pool
+
 logger = logging.getLogger(__name__)
 
+# Longest waits for the product cards and for a scroll to load more content, in seconds
+_CARD_TIMEOUT = 10
+_SCROLL_TIMEOUT = 2
+
+# Runs the shared card extractor, which Selenium needs wrapped in a script body
+_EXTRACT_PRODUCTS_JS = f"return ({_justyol_schema.PAGE_JS_EXTRACTOR})(arguments[0]);"
+
+# Page assets and trackers the scraper doesn't need, blocked to speed up page loads
+_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.woff", "*.woff2", "*.ttf", "*.mp4",
+    "*google-analytics.com*", "*googletagmanager.com*", "*facebook.net*", "*facebook.com*", "*hotjar.com*"
+]
+
+# Shared by every scrape so products.json requests reuse the same connections
+_HTTP = httpx.Client(headers=products_json.HEADERS, follow_redirects=True, limits=httpx.Limits(max_connections=16, keepalive_expiry=60))
+atexit.register(_HTTP.close)
+
 class JustYolSeleniumScraper:
     """Scraper that uses Selenium to monitor network requests and extract JustYol product data."""
     
@@ -40,32 +62,34 @@ class JustYolSeleniumScraper:
         Returns:
             A list of dictionaries containing product information
         """
-        # Set up Chrome options
-        options = Options()
-        if self.headless:
-            options.add_argument("--headless")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--disable-notifications")
-        options.add_argument("--disable-popup-blocking")
-        options.add_argument("--disable-infobars")
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36')
-        
-        # Enable DevTools Protocol
-        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        # Read the endpoint the page loads its products from, skipping the browser
+        products = products_json.fetch_products_sync(_HTTP, url, pages)
+        if products:
+            logger.info(f"Retrieved {len(products)} products from products.json")
+            return products
+        logger.info("products.json unavailable, falling back to the browser")
         
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        # Reuse a browser left open by an earlier scrape when one is idle
+        pool = get_driver_pool(self.headless, lambda: _create_driver(self.headless))
+        driver = pool.acquire()
         
         try:
+            # Drop the network log left over from the driver's previous scrape
+            driver.get_log('performance')
+            
             logger.info("Monitoring network requests...")
             driver.get(url)
-            time.sleep(5)  # Wait for initial load
+            _wait_for_cards(driver)
             
-            # Scroll down to trigger more requests
+            # Scroll down to trigger more requests until the page stops growing
             for _ in range(5):
+                last_height = driver.execute_script("return document.body.scrollHeight")
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+                try:
+                    WebDriverWait(driver, _SCROLL_TIMEOUT, poll_frequency=0.2).until(
+                        lambda d: d.execute_script("return document.body.scrollHeight") > last_height)
+                except TimeoutException:
+                    break
             
             # Extract network logs
             logs = driver.get_log('performance')
@@ -73,8 +97,12 @@ class JustYolSeleniumScraper:
             # Look for XHR/Fetch requests with product data
             api_responses = []
             for log in logs:
+                # Skip the other events without decoding them, most entries aren't responses
+                message = log["message"]
+                if '"Network.responseReceived"' not in message or "products" not in message:
+                    continue
                 try:
-                    log_entry = json.loads(log["message"])["message"]
+                    log_entry = json.loads(message)["message"]
                     if "Network.responseReceived" in log_entry["method"]:
                         request_id = log_entry["params"]["requestId"]
                         resp_url = log_entry["params"]["response"]["url"]
@@ -104,99 +132,20 @@ class JustYolSeleniumScraper:
                 try:
                     page_url = f"{url}?page={page}" if "?" not in url else f"{url}&page={page}"
                     driver.get(page_url)
-                    time.sleep(5)  # Wait for page to load
+                    _wait_for_cards(driver)
                     
                     # Check if we're still on a valid page
                     if "page not found" in driver.title.lower() or "404" in driver.title.lower():
                         break
                     
-                    # Find all products on the page
-                    product_cards = driver.find_elements(By.CSS_SELECTOR, '.product-card')
-                    if not product_cards:
-                        # Try alternative selectors
-                        product_cards = driver.find_elements(By.CSS_SELECTOR, 'div.hdt-card-product')
-                        
-                    if not product_cards:
+                    # Read every product card in a single call into the page
+                    raws = driver.execute_script(_EXTRACT_PRODUCTS_JS, _justyol_schema.SELECTORS)
+                    page_products = [_justyol_schema.normalize(raw) for raw in raws]
+                    if not page_products:
                         break
-                        
-                    logger.info(f"Found {len(product_cards)} products on page {page}")
                     
-                    # Extract product data
-                    for card in product_cards:
-                        try:
-                            product = {}
-                            
-                            # Extract product name and URL
-                            name_el = None
-                            try:
-                                name_el = card.find_element(By.CSS_SELECTOR, '.product-card-title')
-                            except:
-                                try:
-                                    name_el = card.find_element(By.CSS_SELECTOR, 'a.hdt-card-product__title')
-                                except:
-                                    pass
-                                    
-                            if name_el:
-                                product["name"] = name_el.text.strip()
-                                
-                                # Try to get URL
-                                try:
-                                    url_el = name_el if name_el.tag_name == 'a' else card.find_element(By.CSS_SELECTOR, 'a')
-                                    product_url = url_el.get_attribute("href")
-                                    if product_url:
-                                        product["url"] = product_url
-                                except:
-                                    pass
-                            
-                            # Extract brand
-                            try:
-                                brand_el = card.find_element(By.CSS_SELECTOR, '.product-card-vendor')
-                                product["brand"] = brand_el.text.strip()
-                            except:
-                                pass
-                            
-                            # Extract price
-                            try:
-                                price_el = card.find_element(By.CSS_SELECTOR, '.sale-price')
-                                product["price"] = price_el.text.strip()
-                            except:
-                                try:
-                                    price_el = card.find_element(By.CSS_SELECTOR, '.product-card-price')
-                                    product["price"] = price_el.text.strip()
-                                except:
-                                    product["price"] = "N/A"
-                            
-                            # Extract original price
-                            try:
-                                original_price_el = card.find_element(By.CSS_SELECTOR, '.compare-at-price')
-                                product["original_price"] = original_price_el.text.strip()
-                            except:
-                                product["original_price"] = product.get("price", "N/A")
-                            
-                            # Extract discount
-                            try:
-                                discount_el = card.find_element(By.CSS_SELECTOR, '.product-card-badge.sale')
-                                product["discount"] = discount_el.text.strip()
-                            except:
-                                pass
-                            
-                            # Extract image
-                            try:
-                                img_el = card.find_element(By.TAG_NAME, 'img')
-                                img_url = img_el.get_attribute("src") or img_el.get_attribute("data-src")
-                                if img_url:
-                                    if img_url.startswith("//"):
-                                        img_url = "https:" + img_url
-                                    product["image_url"] = img_url
-                            except:
-                                pass
-                            
-                            # Only add products with at least a name
-                            if "name" in product:
-                                all_products.append(product)
-                        except Exception as e:
-                            logger.warning(f"Error extracting product: {str(e)}")
-                            continue
+                    logger.info(f"Found {len(page_products)} products on page {page}")
+                    all_products.extend(page_products)
                 except Exception as e:
                     logger.warning(f"Error processing page {page}: {str(e)}")
                     break
@@ -207,4 +156,54 @@ class JustYolSeleniumScraper:
             logger.error(f"Error monitoring network: {str(e)}")
             return []
         finally:
-            driver.quit()
+            pool.release(driver)
+
+
+def _wait_for_cards(driver: webdriver.Chrome) -> bool:
+    """
+    Wait until the current page shows product cards.
+    
+    Args:
+        driver: The driver that loaded the page
+    
+    Returns:
+        True if product cards appeared before the timeout
+    """
+    try:
+        WebDriverWait(driver, _CARD_TIMEOUT, poll_frequency=0.2).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, _justyol_schema.CARD_SELECTOR)))
+        return True
+    except TimeoutException:
+        return False
+
+
+def _create_driver(headless: bool) -> webdriver.Chrome:
+    """
+    Start a Chrome driver set up for network monitoring.
+    
+    Args:
+        headless: Whether to run the browser in headless mode
+    
+    Returns:
+        The new driver
+    """
+    # Set up Chrome options
+    options = Options()
+    if headless:
+        options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-notifications")
+    options.add_argument("--disable-popup-blocking")
+    options.add_argument("--disable-infobars")
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36')
+    
+    # Enable DevTools Protocol
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    
+    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_URLS})
+    return driver
@@ -0,0 +1,77 @@
+"""
+Unit tests for the concurrent task helpers.
+"""
+
+import asyncio
+import unittest
+from scraper.concurrency import bounded_iter
+
+
+class TestConcurrency(unittest.TestCase):
+    """Test cases for bounded_iter."""
+    
+    def test_bounded_iter(self):
+        """Test that results keep their order and at most `limit` tasks run at once."""
+        running = []
+        peak = []
+        
+        async def job(i):
+            running.append(i)
+            peak.append(len(running))
+            await asyncio.sleep(0.001 * (5 - i % 5))
+            running.remove(i)
+            return i
+        
+        async def collect(coros, limit):
+            return [result async for result in bounded_iter(coros, limit)]
+        
+        results = asyncio.run(collect((job(i) for i in range(12)), 3))
+        
+        self.assertEqual(results, list(range(12)))
+        self.assertEqual(max(peak), 3)
+    
+    def test_bounded_iter_failure(self):
+        """Test that a failure is raised after the other tasks were cancelled and cleaned up."""
+        cleaned_up = []
+        
+        async def job():
+            try:
+                await asyncio.sleep(1)
+            finally:
+                await asyncio.sleep(0)
+                cleaned_up.append(True)
+        
+        async def fail():
+            raise ValueError("page failed")
+        
+        async def collect():
+            return [result async for result in bounded_iter([fail(), job(), job()], 5)]
+        
+        with self.assertRaises(ValueError):
+            asyncio.run(collect())
+        self.assertEqual(cleaned_up, [True, True])
+    
+    def test_bounded_iter_closed_early(self):
+        """Test that closing the iterator early waits for the cancelled tasks' cleanup."""
+        cleaned_up = []
+        
+        async def job(i):
+            try:
+                await asyncio.sleep(0 if i == 0 else 1)
+                return i
+            finally:
+                await asyncio.sleep(0)
+                cleaned_up.append(i)
+        
+        async def first_result():
+            results = bounded_iter((job(i) for i in range(5)), 3)
+            async for result in results:
+                break
+            await results.aclose()
+            return result, sorted(cleaned_up)
+        
+        self.assertEqual(asyncio.run(first_result()), (0, [0, 1, 2]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,19 +3,35 @@ Unit tests for the data cleaning functions specific to JustYol data.
 """
 
 import unittest
-from data_processor.cleaner import clean_name, clean_price, clean_discount
+from types import MappingProxyType
+from data_processor.cleaner import clean_product_data, clean_product_data_iter, clean_name, clean_price, clean_discount
 
+# A product name, and the same name with extra whitespace
+_NAME_NORMAL = "Simple Siyah Kol Çantası"
+_NAME_WS = "  Simple   Siyah  Kol  Çantası  "
+
+# Raw products shared by the tests, read-only so no test can change them for another
+_FIXTURES = (
+    MappingProxyType({'name': 'Test Product 1', 'price': '152 dh', 'discount': '-50%'}),
+    MappingProxyType({'name': 'Test Product 2', 'price': 99.99}),
+    MappingProxyType({'name': ' Test  Product 3 ', 'original_price': '299.99 dh'})
+)
 
 class TestJustYolCleaner(unittest.TestCase):
     """Test cases for JustYol data cleaning functions."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Share the module fixtures with every test."""
+        cls.fixtures = _FIXTURES
+    
     def test_clean_name(self):
         """Test the clean_name function."""
         # Test normal name
-        self.assertEqual(clean_name("Simple Siyah Kol Çantası"), "Simple Siyah Kol Çantası")
+        self.assertEqual(clean_name(_NAME_NORMAL), _NAME_NORMAL)
         
         # Test name with extra whitespace
-        self.assertEqual(clean_name("  Simple   Siyah  Kol  Çantası  "), "Simple Siyah Kol Çantası")
+        self.assertEqual(clean_name(_NAME_WS), _NAME_NORMAL)
         
         # Test None input
         self.assertIsNone(clean_name(None))
@@ -28,6 +44,10 @@ class TestJustYolCleaner(unittest.TestCase):
         # Test price with decimal
         self.assertEqual(clean_price("152.99 dh"), 152.99)
         
+        # Test numeric input
+        self.assertEqual(clean_price(99.99), 99.99)
+        self.assertEqual(clean_price(152), 152.0)
+        
         # Test None input
         self.assertIsNone(clean_price(None))
         
@@ -47,6 +67,74 @@ class TestJustYolCleaner(unittest.TestCase):
         
         # Test invalid discount
         self.assertIsNone(clean_discount("Sale"))
+    
+    def test_clean_product_data(self):
+        """Test the clean_product_data function."""
+        cleaned = clean_product_data([
+            {
+                'name': _NAME_WS,
+                'brand': 'JustYol',
+                'price': '152.99 dh',
+                'original_price': '299 dh',
+                'discount': '-50%',
+                'url': 'https://justyol.com/en/products/test-product-1'
+            },
+            {
+                'name': 'Test Product 2',
+                'price': 'Price not available',
+                'discount': 'Sale'
+            }
+        ])
+        
+        # Check that every product has all the output fields
+        self.assertEqual(len(cleaned), 2)
+        self.assertEqual(list(cleaned[1]), ['name', 'brand', 'price', 'original_price', 'discount', 'url', 'image_url'])
+        
+        # Check that the values match the per-field cleaning functions
+        self.assertEqual(cleaned[0]['name'], _NAME_NORMAL)
+        self.assertEqual(cleaned[0]['brand'], 'JustYol')
+        self.assertEqual(cleaned[0]['price'], 152.99)
+        self.assertEqual(cleaned[0]['original_price'], 299.0)
+        self.assertEqual(cleaned[0]['discount'], 50)
+        self.assertIsNone(cleaned[0]['image_url'])
+        
+        # Check that unparseable values become None
+        self.assertIsNone(cleaned[1]['brand'])
+        self.assertIsNone(cleaned[1]['price'])
+        self.assertIsNone(cleaned[1]['original_price'])
+        self.assertIsNone(cleaned[1]['discount'])
+        
+        # Test empty input
+        self.assertEqual(clean_product_data([]), [])
+    
+    def test_clean_product_data_numeric(self):
+        """Test that numeric values are cleaned like clean_price and clean_discount do."""
+        cleaned = clean_product_data([{'name': 'Test Product', 'price': 99.99, 'original_price': 152, 'discount': 50.5}])
+        
+        self.assertEqual(cleaned[0]['price'], clean_price(99.99))
+        self.assertEqual(cleaned[0]['original_price'], clean_price(152))
+        self.assertEqual(cleaned[0]['discount'], clean_discount(50.5))
+    
+    def test_clean_product_data_without_names(self):
+        """Test a batch in which no product has a string name."""
+        cleaned = clean_product_data([{'title': 'Test Product'}])
+        
+        self.assertIsNone(cleaned[0]['name'])
+    
+    def test_clean_product_data_arabic_digits(self):
+        """Test that Arabic-Indic digits are read like clean_price and clean_discount do."""
+        cleaned = clean_product_data([{'name': 'Test Product', 'price': '٣٤ dh', 'discount': '-٥٠%'}])
+        
+        self.assertEqual(cleaned[0]['price'], clean_price('٣٤ dh'))
+        self.assertEqual(cleaned[0]['discount'], clean_discount('-٥٠%'))
+    
+    def test_clean_product_data_iter(self):
+        """Test that cleaning in batches matches cleaning the whole list."""
+        products = [dict(product) for product in self.fixtures]
+        
+        cleaned = clean_product_data_iter(iter(products), batch_size=2)
+        
+        self.assertEqual(list(cleaned), clean_product_data(products))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,71 @@
+"""
+Unit tests for the product card schema shared by the browser scrapers.
+"""
+
+import unittest
+from playwright._impl._js_handle import parse_value, serialize_argument
+from scraper._justyol_schema import SELECTORS, normalize
+
+
+def _raw(**fields):
+    """Build a page extractor result, with every field missing unless given."""
+    raw = dict.fromkeys(['name', 'brand', 'price', 'original_price', 'discount', 'url', 'image_url'])
+    raw.update(fields)
+    return raw
+
+
+class TestNormalize(unittest.TestCase):
+    """Test cases for normalize."""
+    
+    def test_normalize(self):
+        """Test that the fields are passed through unchanged."""
+        product = normalize(_raw(
+            name='Simple Siyah Kol Çantası',
+            brand='JustYol',
+            price='152 dh',
+            original_price='299 dh',
+            discount='-50%',
+            url='https://justyol.com/en/products/bag',
+            image_url='https://cdn.example.com/bag.jpg'
+        ))
+        
+        self.assertEqual(product, {
+            'name': 'Simple Siyah Kol Çantası',
+            'brand': 'JustYol',
+            'price': '152 dh',
+            'original_price': '299 dh',
+            'discount': '-50%',
+            'url': 'https://justyol.com/en/products/bag',
+            'image_url': 'https://cdn.example.com/bag.jpg'
+        })
+    
+    def test_normalize_urls(self):
+        """Test that relative and protocol-relative URLs are completed."""
+        product = normalize(_raw(name='Bag', url='/en/products/bag', image_url='//cdn.example.com/bag.jpg'))
+        
+        self.assertEqual(product['url'], 'https://justyol.com/en/products/bag')
+        self.assertEqual(product['image_url'], 'https://cdn.example.com/bag.jpg')
+        
+        # Check that missing or empty URLs become None
+        self.assertIsNone(normalize(_raw(name='Bag'))['url'])
+        self.assertIsNone(normalize(_raw(name='Bag', image_url=''))['image_url'])
+    
+    def test_normalize_original_price(self):
+        """Test that the original price falls back to the price."""
+        self.assertEqual(normalize(_raw(name='Bag', price='152 dh'))['original_price'], '152 dh')
+        self.assertIsNone(normalize(_raw(name='Bag'))['original_price'])
+
+
+
+class TestSelectors(unittest.TestCase):
+    """Test cases for the selectors passed into the page."""
+    
+    def test_selectors_reach_the_page(self):
+        """Test that Playwright serializes every selector instead of sending undefined."""
+        serialized = serialize_argument(SELECTORS)
+        
+        self.assertEqual(parse_value(serialized['value']), SELECTORS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Unit tests for the output functions.
+"""
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from data_processor.cleaner import PRODUCT_FIELDS
+from data_processor.output import save_to_csv, save_to_json, save_to_sqlite
+
+
+def _product(i):
+    """Build a cleaned product with every output field."""
+    return dict(zip(PRODUCT_FIELDS, (f'Product {i}', 'JustYol', 99.5, 120.0, 17, f'https://justyol.com/en/products/p{i}', None)))
+
+
+def _failing_products():
+    """Yield some products, then fail like a cleaning error would."""
+    for i in range(1500):
+        yield _product(i)
+    raise ValueError("cleaning failed")
+
+
+class TestSaveToFile(unittest.TestCase):
+    """Test cases for the CSV and JSON writers."""
+    
+    def setUp(self):
+        """Create a temporary directory for the output files."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name)
+    
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+    
+    def _assert_keeps_previous_file(self, save, filename):
+        """Check that a failed save leaves the previous file and no temporary file."""
+        file_path = self.path / filename
+        save([_product(0)], str(file_path))
+        previous = file_path.read_bytes()
+        
+        with self.assertRaises(ValueError):
+            save(_failing_products(), str(file_path))
+        
+        self.assertEqual(file_path.read_bytes(), previous)
+        self.assertEqual(list(self.path.iterdir()), [file_path])
+    
+    def test_save_to_csv_is_atomic(self):
+        """Test that a failure while producing the products keeps the previous CSV."""
+        self._assert_keeps_previous_file(save_to_csv, 'products.csv')
+    
+    def test_save_to_json_is_atomic(self):
+        """Test that a failure while producing the products keeps the previous JSON."""
+        self._assert_keeps_previous_file(save_to_json, 'products.json')
+
+
+class TestSaveToSqlite(unittest.TestCase):
+    """Test cases for the SQLite writer."""
+    
+    def setUp(self):
+        """Create a database file in a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_file = str(Path(self.tmp_dir.name) / 'products.db')
+    
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+    
+    def _rows(self):
+        """Return the saved product rows."""
+        conn = sqlite3.connect(self.db_file)
+        try:
+            return conn.execute(f"SELECT {', '.join(PRODUCT_FIELDS)} FROM products ORDER BY id").fetchall()
+        finally:
+            conn.close()
+    
+    def test_save_to_sqlite(self):
+        """Test that every product is saved, also beyond SQLite's old 999-parameter limit."""
+        save_to_sqlite((_product(i) for i in range(2000)), self.db_file)
+        
+        rows = self._rows()
+        self.assertEqual(len(rows), 2000)
+        self.assertEqual(rows[0], ('Product 0', 'JustYol', 99.5, 120.0, 17, 'https://justyol.com/en/products/p0', None))
+        self.assertEqual(rows[-1][0], 'Product 1999')
+    
+    def test_save_to_sqlite_is_atomic(self):
+        """Test that a failure while producing the products saves none of them."""
+        with self.assertRaises(ValueError):
+            save_to_sqlite(_failing_products(), self.db_file)
+        
+        self.assertEqual(self._rows(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Unit tests for the products.json client.
+"""
+
+import asyncio
+import unittest
+import httpx
+import orjson
+from scraper.products_json import fetch_products_sync, parse_products, stream_pages
+
+
+def _body(*products):
+    """Encode a products.json response body."""
+    return orjson.dumps({'products': list(products)})
+
+
+def _shopify_product(handle):
+    """Build a minimal Shopify product."""
+    return {
+        'title': handle.title(),
+        'vendor': 'JustYol',
+        'handle': handle,
+        'variants': [{'price': '99.00', 'compare_at_price': '120.00'}],
+        'images': [{'src': f'https://cdn.example.com/{handle}.jpg'}]
+    }
+
+
+class TestParseProducts(unittest.TestCase):
+    """Test cases for parse_products."""
+    
+    def test_parse_products(self):
+        """Test the mapping of a complete Shopify product."""
+        products = parse_products(_body(_shopify_product('red-bag')))
+        
+        self.assertEqual(products, [{
+            'name': 'Red-Bag',
+            'brand': 'JustYol',
+            'price': '99.00',
+            'original_price': '120.00',
+            'discount': None,
+            'url': 'https://justyol.com/en/products/red-bag',
+            'image_url': 'https://cdn.example.com/red-bag.jpg'
+        }])
+    
+    def test_parse_products_missing_fields(self):
+        """Test products without variants, images, compare price or handle."""
+        products = parse_products(_body(
+            {'title': 'No Variants', 'variants': [], 'images': []},
+            {'title': 'No Compare Price', 'variants': [{'price': '50.00', 'compare_at_price': None}]}
+        ))
+        
+        self.assertIsNone(products[0]['price'])
+        self.assertIsNone(products[0]['original_price'])
+        self.assertIsNone(products[0]['url'])
+        self.assertIsNone(products[0]['image_url'])
+        
+        # Check that the original price falls back to the price
+        self.assertEqual(products[1]['original_price'], '50.00')
+    
+    def test_parse_products_invalid_body(self):
+        """Test that bodies other than a product listing are rejected."""
+        self.assertIsNone(parse_products(b'<html></html>'))
+        self.assertIsNone(parse_products(b'[]'))
+        self.assertIsNone(parse_products(b'{"products": {}}'))
+        self.assertEqual(parse_products(_body()), [])
+
+
+class TestFetchProducts(unittest.TestCase):
+    """Test cases for fetching a collection's pages."""
+    
+    def setUp(self):
+        """Serve two pages of products, then an empty page."""
+        self.requested_pages = []
+        
+        def handler(request):
+            page = int(request.url.params['page'])
+            self.requested_pages.append(page)
+            if request.url.path != '/collections/women-handbags/products.json':
+                return httpx.Response(404)
+            if page > 2:
+                return httpx.Response(200, content=_body())
+            return httpx.Response(200, content=_body(_shopify_product(f'bag-{page}')))
+        
+        self.transport = httpx.MockTransport(handler)
+    
+    def _fetch(self, url, pages):
+        """Fetch the pages with an async client over the mock transport."""
+        async def fetch():
+            async with httpx.AsyncClient(transport=self.transport) as client:
+                return [product async for page in stream_pages(client, url, pages) for product in page]
+        return asyncio.run(fetch())
+    
+    def test_stream_pages(self):
+        """Test that pages are combined in order up to the first empty one."""
+        products = self._fetch('https://justyol.com/en/collections/women-handbags', 5)
+        
+        self.assertEqual([product['name'] for product in products], ['Bag-1', 'Bag-2'])
+    
+    def test_stream_pages_failed_page(self):
+        """Test that a collection whose endpoint fails returns no products."""
+        self.assertEqual(self._fetch('https://justyol.com/en/collections/missing', 2), [])
+    
+    def test_stream_pages_not_a_collection(self):
+        """Test that a URL without a collection sends no request."""
+        self.assertEqual(self._fetch('https://justyol.com/en/products/red-bag', 2), [])
+        self.assertEqual(self.requested_pages, [])
+    
+    def test_fetch_products_sync(self):
+        """Test that the sync client stops after the first empty page."""
+        with httpx.Client(transport=self.transport) as client:
+            products = fetch_products_sync(client, 'https://justyol.com/en/collections/women-handbags', 5)
+        
+        self.assertEqual(len(products), 2)
+        self.assertEqual(self.requested_pages, [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,47 +3,55 @@ Unit tests for the data standardization functions.
 """
 
 import unittest
+from types import MappingProxyType
 from data_processor.standardizer import standardize_products
 
 
+# Test products from different sources, read-only so no test can change them for another
+_FIXTURES = (
+    # API format
+    MappingProxyType({
+        'title': 'Test Product 1',
+        'vendor': 'JustYol',
+        'price_min': 99.99,
+        'handle': 'test-product-1',
+        'images': [{'src': 'https://example.com/image1.jpg'}]
+    }),
+    # Selenium format
+    MappingProxyType({
+        'name': 'Test Product 2',
+        'brand': 'JWomen',
+        'price': '199.99 dh',
+        'original_price': '299.99 dh',
+        'discount': '-33%',
+        'url': 'https://justyol.com/en/products/test-product-2',
+        'image_url': 'https://example.com/image2.jpg'
+    }),
+    # Playwright format
+    MappingProxyType({
+        'name': 'Test Product 3',
+        'brand': 'JKids',
+        'price': '50 dh',
+        'original_price': '100 dh',
+        'discount': '-50%',
+        'url': 'https://justyol.com/en/products/test-product-3',
+        'image': 'https://example.com/image3.jpg'
+    })
+)
+
+
 class TestStandardizer(unittest.TestCase):
     """Test cases for data standardization functions."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Share the module fixtures with every test."""
+        cls.fixtures = _FIXTURES
+    
     def test_standardize_products(self):
         """Test the standardize_products function."""
-        # Test products from different sources
-        test_products = [
-            # API format
-            {
-                'title': 'Test Product 1',
-                'vendor': 'JustYol',
-                'price_min': 99.99,
-                'handle': 'test-product-1',
-                'images': [{'src': 'https://example.com/image1.jpg'}]
-            },
-            # Selenium format
-            {
-                'name': 'Test Product 2',
-                'brand': 'JWomen',
-                'price': '199.99 dh',
-                'original_price': '299.99 dh',
-                'discount': '-33%',
-                'url': 'https://justyol.com/en/products/test-product-2',
-                'image_url': 'https://example.com/image2.jpg'
-            },
-            # Playwright format
-            {
-                'name': 'Test Product 3',
-                'brand': 'JKids',
-                'price': '50 dh',
-                'original_price': '100 dh',
-                'discount': '-50%',
-                'url': 'https://justyol.com/en/products/test-product-3',
-                'image': 'https://example.com/image3.jpg'
-            }
-        ]
-        
-        standardized = standardize_products(test_products)
+        # The standardizer only accepts dicts, so pass copies of the fixtures
+        standardized = standardize_products(dict(product) for product in self.fixtures)
         
         # Check that we have the correct number of products
         self.assertEqual(len(standardized), 3)
@@ -70,6 +78,74 @@ class TestStandardizer(unittest.TestCase):
         self.assertEqual(standardized[2]['discount'], '-50%')
         self.assertEqual(standardized[2]['url'], 'https://justyol.com/en/products/test-product-3')
         self.assertEqual(standardized[2]['image_url'], 'https://example.com/image3.jpg')
+    
+    def test_standardize_variants(self):
+        """Test that prices fall back to the first variant."""
+        standardized = standardize_products([
+            {'title': 'Variant Product', 'variants': [{'price': '120.00', 'compare_at_price': '150.00'}, {'price': '1.00'}]},
+            {'title': 'Variant Without Compare Price', 'variants': [{'price': '80.00'}]},
+            {'title': 'No Variants', 'variants': []}
+        ])
+        
+        self.assertEqual(standardized[0]['price'], '120.00')
+        self.assertEqual(standardized[0]['original_price'], '150.00')
+        
+        # Check that the original price falls back to the price
+        self.assertEqual(standardized[1]['price'], '80.00')
+        self.assertEqual(standardized[1]['original_price'], '80.00')
+        
+        self.assertIsNone(standardized[2]['price'])
+        self.assertIsNone(standardized[2]['original_price'])
+    
+    def test_standardize_compare_at_price(self):
+        """Test that a top-level compare_at_price is used as the original price."""
+        standardized = standardize_products([
+            {'name': 'Sale Product', 'price': '50 dh', 'compare_at_price': '70 dh', 'variants': [{'compare_at_price': '1 dh'}]}
+        ])
+        
+        self.assertEqual(standardized[0]['original_price'], '70 dh')
+    
+    def test_standardize_images(self):
+        """Test the image fields of the different sources."""
+        standardized = standardize_products([
+            {'name': 'Featured Image', 'featured_image': 'https://example.com/featured.jpg'},
+            {'name': 'Image Dict', 'image': {'src': 'https://example.com/dict.jpg'}},
+            {'name': 'Image String List', 'images': ['https://example.com/list.jpg']},
+            {'name': 'No Image', 'images': []}
+        ])
+        
+        self.assertEqual([product['image_url'] for product in standardized], [
+            'https://example.com/featured.jpg',
+            'https://example.com/dict.jpg',
+            'https://example.com/list.jpg',
+            None
+        ])
+    
+    def test_standardize_url(self):
+        """Test that the URL is built from the handle when missing."""
+        standardized = standardize_products([
+            {'name': 'Handle Product', 'handle': 'handle-product'},
+            {'name': 'URL Product', 'url': 'https://justyol.com/en/products/url-product', 'handle': 'ignored'},
+            {'name': 'No URL'}
+        ])
+        
+        self.assertEqual(standardized[0]['url'], 'https://justyol.com/en/products/handle-product')
+        self.assertEqual(standardized[1]['url'], 'https://justyol.com/en/products/url-product')
+        self.assertIsNone(standardized[2]['url'])
+    
+    def test_standardize_skips_unnamed_products(self):
+        """Test that products without a real name, and non-dict entries, are skipped."""
+        standardized = standardize_products([
+            {'brand': 'JustYol', 'price': '10 dh'},
+            {'name': '', 'price': '10 dh'},
+            {'title': None},
+            {'name': 'Unknown Product', 'price': '10 dh'},
+            'not a product',
+            {'title': 'Named Product'}
+        ])
+        
+        self.assertEqual([product['name'] for product in standardized], ['Named Product'])
+        self.assertEqual(list(standardized[0]), ['name', 'brand', 'price', 'original_price', 'discount', 'url', 'image_url'])
 
 
 if __name__ == "__main__":